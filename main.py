@@ -1,30 +1,28 @@
 import os
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Literal, Dict, Any
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, EmailStr
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError
 from bson import ObjectId
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
+from pymongo import DeleteMany
+from pymongo.errors import DuplicateKeyError, PyMongoError
 
-from database import db
-from schemas import Team, TeamSettings, User, UserDevice, Record, LogEntry, JournalEntry, Reminder, StickyNote
+from database import async_db as db
+from schemas import Email, Team
 
-# ---------- Helpers ----------
+logger = logging.getLogger(__name__)
 
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+# ---------- Helpers ----------
 
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        try:
-            return ObjectId(str(v))
-        except Exception:
-            raise ValueError("Invalid ObjectId")
+_UTC = timezone.utc
 
 def oid(value: str) -> ObjectId:
     try:
@@ -32,26 +30,205 @@ def oid(value: str) -> ObjectId:
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid id")
 
-# ---------- App ----------
+class _ObjectIdAsStr(TypeDecoder):
+    bson_type = ObjectId
+
+    def transform_bson(self, value: ObjectId) -> str:
+        return str(value)
+
+_STR_ID_CODEC = CodecOptions(type_registry=TypeRegistry([_ObjectIdAsStr()]))
+
+_read_collections: Dict[str, Any] = {}
+
+def read_collection(name: str):
+    """Collection handle for read endpoints; the driver decodes ObjectIds as hex strings.
+
+    Handles are built on first use and reused for the life of the process.
+    """
+    coll = _read_collections.get(name)
+    if coll is None:
+        coll = _read_collections[name] = db.get_collection(name, codec_options=_STR_ID_CODEC)
+    return coll
+
+class TTLCache:
+    """Tiny per-process cache whose entries expire ttl seconds after being set.
+
+    Readers take token(key) before fetching and pass it to set(); if the key was
+    invalidated in the meantime the set is dropped, so a read that started
+    before a write cannot put the old value back.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.d: Dict[Any, Any] = {}
+        self._gens: Dict[Any, int] = {}
+        # Bumped whenever _gens is cleared so tokens taken before the clear stay stale
+        self._epoch = 0
+
+    def token(self, key: Any) -> Any:
+        return (self._epoch, self._gens.get(key, 0))
+
+    def get(self, key: Any) -> Any:
+        entry = self.d.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(self, key: Any, value: Any, token: Any = None) -> None:
+        if token is not None and token != self.token(key):
+            return
+        if len(self.d) >= self.maxsize:
+            self.d.clear()
+        self.d[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Any) -> None:
+        self.d.pop(key, None)
+        if len(self._gens) >= self.maxsize:
+            self._gens.clear()
+            self._epoch += 1
+        self._gens[key] = self._gens.get(key, 0) + 1
+
+def json_body(model: type[BaseModel]):
+    """Dependency that validates the raw request body with model_validate_json.
+
+    Parses and validates in one pass (pydantic-core's JSON parser) instead of
+    json.loads followed by dict validation. Errors are reported like FastAPI's
+    own body validation (422, loc prefixed with "body").
+    """
+
+    async def parse(request: Request):
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+            )
+
+    return parse
+
+def json_body_doc(model: type[BaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a body that is parsed by json_body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError
+
+class MongoJSONResponse(ORJSONResponse):
+    """orjson response that serializes Mongo documents as-is.
 
-app = FastAPI(title="Team Logger API")
+    Datetimes read back from Mongo are naive UTC, so they are tagged as such;
+    any ObjectId left in a document is rendered as its hex string.
+    """
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NAIVE_UTC)
+
+_CORS_HEADERS = (
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+)
+_CORS_PREFLIGHT_HEADERS = _CORS_HEADERS + (
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
 )
 
+class FastCORS:
+    """Allow-all CORS policy with precomputed headers.
+
+    Same policy the app used with CORSMiddleware (any origin, method and
+    header, with credentials) but without per-request policy matching. The
+    request Origin is echoed because browsers reject "*" on credentialed
+    requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        origin = request_method = request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+        if origin is None:
+            return await self.app(scope, receive, send)
+
+        allow_origin = (b"access-control-allow-origin", origin)
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [allow_origin, *_CORS_PREFLIGHT_HEADERS]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), allow_origin, *_CORS_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+# ---------- App ----------
+
+app = FastAPI(title="Team Logger API", default_response_class=MongoJSONResponse)
+
+app.add_middleware(FastCORS)
+
+@app.on_event("startup")
+async def ensure_indexes():
+    if db is None:
+        return
+    try:
+        await _create_indexes()
+    except PyMongoError:
+        # Keep serving (and reporting the problem on /test) rather than failing to boot
+        logger.exception("Could not create MongoDB indexes; starting without them")
+
+async def _create_indexes():
+    # Lets create_user rely on insert_one alone for duplicate detection
+    try:
+        await db["user"].create_index("email", unique=True)
+    except DuplicateKeyError:
+        logger.error(
+            "user.email holds duplicate values; unique index not created, "
+            "so duplicate registrations are not rejected with 409 until the duplicates are removed"
+        )
+    # Serve the record/trash/reminder list queries (filter + sort) straight from an index
+    await db["record"].create_index([("team_id", 1), ("deleted_at", 1), ("created_at", -1), ("_id", -1)])
+    await db["record"].create_index(
+        [("team_id", 1), ("deleted_at", -1)],
+        partialFilterExpression={"deleted_at": {"$type": "date"}},
+    )
+    # TTL index: mongod deletes trashed records itself once purge_at has passed
+    await db["record"].create_index(
+        [("purge_at", 1)],
+        expireAfterSeconds=0,
+        partialFilterExpression={"purge_at": {"$exists": True}},
+    )
+    await db["reminder"].create_index([("team_id", 1), ("created_at", -1)])
+
 # ---------- Root & Health ----------
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Team Logger API Running"}
 
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -67,7 +244,7 @@ def test_database():
             response["database_name"] = db.name
             response["connection_status"] = "Connected"
             try:
-                response["collections"] = db.list_collection_names()
+                response["collections"] = await db.list_collection_names()
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
                 response["database"] = f"⚠️ Connected but error: {str(e)[:80]}"
@@ -78,24 +255,25 @@ def test_database():
 # ---------- Users ----------
 
 class CreateUserRequest(BaseModel):
-    email: EmailStr
+    email: Email
     name: str
     password: str = Field(..., min_length=6)
     age: Optional[int] = Field(None, ge=0, le=120)
     theme_preference: Literal["family", "neutral"] = "family"
 
-@app.post("/api/users")
-def create_user(payload: CreateUserRequest):
-    if db["user"].find_one({"email": payload.email}):
+@app.post("/api/users", openapi_extra=json_body_doc(CreateUserRequest))
+async def create_user(payload: CreateUserRequest = Depends(json_body(CreateUserRequest))):
+    # Payload is already validated by the json_body dependency; build the User document directly
+    user = {
+        **payload.model_dump(exclude={"password"}),
+        "password_hash": f"hash:{payload.password}",  # Placeholder for MVP
+        "roles": {},
+        "devices": [],
+    }
+    try:
+        res = await db["user"].insert_one({**user, "created_at": datetime.now(_UTC)})
+    except DuplicateKeyError:
         raise HTTPException(status_code=409, detail="Email already registered")
-    user = User(
-        email=payload.email,
-        name=payload.name,
-        password_hash=f"hash:{payload.password}",  # Placeholder for MVP
-        age=payload.age,
-        theme_preference=payload.theme_preference,
-    ).model_dump()
-    res = db["user"].insert_one({**user, "created_at": datetime.now(timezone.utc)})
     return {"_id": str(res.inserted_id)}
 
 class RegisterDeviceRequest(BaseModel):
@@ -104,62 +282,132 @@ class RegisterDeviceRequest(BaseModel):
     push_token: Optional[str] = None
 
 @app.post("/api/devices/register")
-def register_device(payload: RegisterDeviceRequest):
-    u = db["user"].find_one({"_id": oid(payload.user_id)})
-    if not u:
+async def register_device(payload: RegisterDeviceRequest):
+    uid = oid(payload.user_id)
+    device = {"platform": payload.platform, "push_token": payload.push_token, "last_active_at": datetime.now(_UTC)}
+    res = await db["user"].update_one({"_id": uid}, {"$push": {"devices": device}})
+    if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
-    device = UserDevice(platform=payload.platform, push_token=payload.push_token, last_active_at=datetime.now(timezone.utc)).model_dump()
-    db["user"].update_one({"_id": oid(payload.user_id)}, {"$push": {"devices": device}})
     return {"status": "ok"}
 
+class DeviceRegistration(BaseModel):
+    platform: Optional[str] = None
+    push_token: Optional[str] = None
+
+class RegisterDevicesRequest(BaseModel):
+    user_id: str
+    devices: List[DeviceRegistration] = Field(..., min_length=1)
+
+@app.post("/api/devices/register-bulk")
+async def register_devices(payload: RegisterDevicesRequest):
+    uid = oid(payload.user_id)
+    now = datetime.now(_UTC)
+    devices = [{"platform": d.platform, "push_token": d.push_token, "last_active_at": now} for d in payload.devices]
+    res = await db["user"].update_one({"_id": uid}, {"$push": {"devices": {"$each": devices}}})
+    if res.matched_count == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {"status": "ok", "registered": len(devices)}
+
 # ---------- Teams ----------
 
+# Bound once; equivalent to Team.model_dump() without the per-call lookup
+_TEAM_DUMPER = Team.__pydantic_serializer__.to_python
+
+# Team documents change rarely; writes in this process invalidate, other workers see them within the TTL
+_team_cache = TTLCache(ttl=5)
+
+async def get_team_cached(tid: ObjectId) -> Optional[Dict[str, Any]]:
+    doc = _team_cache.get(tid)
+    if doc is None:
+        token = _team_cache.token(tid)
+        doc = await read_collection("team").find_one({"_id": tid})
+        if doc is not None:
+            _team_cache.set(tid, doc, token)
+    return doc
+
 class CreateTeamRequest(BaseModel):
     name: str
     leader_user_id: str
 
 @app.post("/api/teams")
-def create_team(payload: CreateTeamRequest):
-    if not db["user"].find_one({"_id": oid(payload.leader_user_id)}):
+async def create_team(payload: CreateTeamRequest):
+    leader_id = oid(payload.leader_user_id)
+    # Allocate the team id up front so the team insert and the leader role write
+    # (which doubles as the leader existence check) can run concurrently
+    team_id = ObjectId()
+    team_dict = _TEAM_DUMPER(Team(name=payload.name, leader_id=payload.leader_user_id))
+    insert_res, role_res = await asyncio.gather(
+        db["team"].insert_one({**team_dict, "_id": team_id, "created_at": datetime.now(_UTC)}),
+        db["user"].update_one({"_id": leader_id}, {"$set": {f"roles.{str(team_id)}": "leader"}}),
+        return_exceptions=True,
+    )
+    if isinstance(insert_res, BaseException):
+        if not isinstance(role_res, BaseException):
+            await db["user"].update_one({"_id": leader_id}, {"$unset": {f"roles.{str(team_id)}": ""}})
+        raise insert_res
+    if isinstance(role_res, BaseException) or role_res.matched_count == 0:
+        # Undo the team insert so a failed create leaves nothing behind
+        await db["team"].delete_one({"_id": team_id})
+        _team_cache.invalidate(team_id)
+        if isinstance(role_res, BaseException):
+            raise role_res
         raise HTTPException(status_code=404, detail="Leader user not found")
-    team = Team(name=payload.name, leader_id=payload.leader_user_id)
-    team_dict = team.model_dump()
-    res = db["team"].insert_one({**team_dict, "created_at": datetime.now(timezone.utc)})
-    # Add role to leader
-    db["user"].update_one({"_id": oid(payload.leader_user_id)}, {"$set": {f"roles.{str(res.inserted_id)}": "leader"}})
-    return {"_id": str(res.inserted_id)}
+    return {"_id": str(team_id)}
 
 class InviteRequest(BaseModel):
-    email: EmailStr
+    email: Email
 
 @app.post("/api/teams/{team_id}/invite")
-def invite(team_id: str, payload: InviteRequest):
-    if not db["team"].find_one({"_id": oid(team_id)}):
+async def invite(team_id: str, payload: InviteRequest):
+    tid = oid(team_id)
+    res = await db["team"].update_one({"_id": tid}, {"$addToSet": {"invites": payload.email}})
+    _team_cache.invalidate(tid)
+    if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Team not found")
-    db["team"].update_one({"_id": oid(team_id)}, {"$addToSet": {"invites": payload.email}})
     return {"status": "ok"}
 
 class JoinTeamRequest(BaseModel):
     user_id: str
 
 @app.post("/api/teams/{team_id}/join")
-def join_team(team_id: str, payload: JoinTeamRequest):
-    t = db["team"].find_one({"_id": oid(team_id)})
-    if not t:
+async def join_team(team_id: str, payload: JoinTeamRequest):
+    # Parse both ids before issuing either write so a bad id cannot leave a half-applied join
+    tid = oid(team_id)
+    uid = oid(payload.user_id)
+    role_key = f"roles.{team_id}"
+    # find_one_and_update returns the pre-update user (or None), so a rollback can restore the prior role
+    team_res, user_before = await asyncio.gather(
+        db["team"].update_one({"_id": tid}, {"$addToSet": {"member_ids": payload.user_id}}),
+        db["user"].find_one_and_update({"_id": uid}, {"$set": {role_key: "adult"}}, projection={role_key: 1}),
+        return_exceptions=True,
+    )
+    team_ok = not isinstance(team_res, BaseException) and team_res.matched_count > 0
+    user_ok = not isinstance(user_before, BaseException) and user_before is not None
+    # Undo whichever write landed when the other failed, so a failed join leaves nothing behind
+    if team_ok and not user_ok and team_res.modified_count:
+        await db["team"].update_one({"_id": tid}, {"$pull": {"member_ids": payload.user_id}})
+    if user_ok and not team_ok:
+        prior_role = user_before.get("roles", {}).get(team_id)
+        if prior_role is None:
+            await db["user"].update_one({"_id": uid}, {"$unset": {role_key: ""}})
+        elif prior_role != "adult":
+            await db["user"].update_one({"_id": uid}, {"$set": {role_key: prior_role}})
+    _team_cache.invalidate(tid)
+    for res in (team_res, user_before):
+        if isinstance(res, BaseException):
+            raise res
+    if not team_ok:
         raise HTTPException(status_code=404, detail="Team not found")
-    if not db["user"].find_one({"_id": oid(payload.user_id)}):
+    if not user_ok:
         raise HTTPException(status_code=404, detail="User not found")
-    db["team"].update_one({"_id": oid(team_id)}, {"$addToSet": {"member_ids": payload.user_id}})
-    db["user"].update_one({"_id": oid(payload.user_id)}, {"$set": {f"roles.{team_id}": "adult"}})
     return {"status": "ok"}
 
-@app.get("/api/teams/{team_id}")
-def get_team(team_id: str):
-    t = db["team"].find_one({"_id": oid(team_id)})
+@app.get("/api/teams/{team_id}", response_model=None)
+async def get_team(team_id: str):
+    t = await get_team_cached(oid(team_id))
     if not t:
         raise HTTPException(status_code=404, detail="Team not found")
-    t["_id"] = str(t["_id"]) 
-    return t
+    return MongoJSONResponse(t)
 
 # ---------- Records: Logs & Journals ----------
 
@@ -173,39 +421,82 @@ class CreateRecordRequest(BaseModel):
     occurred_at: Optional[datetime] = None
     title: Optional[str] = None
 
-@app.post("/api/records")
-def create_record(payload: CreateRecordRequest):
+@app.post("/api/records", openapi_extra=json_body_doc(CreateRecordRequest))
+async def create_record(payload: CreateRecordRequest = Depends(json_body(CreateRecordRequest))):
+    # deleted_at/purge_at are left unset; only records written before this stored them as null
+    doc: Dict[str, Any] = {
+        "team_id": payload.team_id,
+        "author_id": payload.author_id,
+        "type": payload.type,
+        "content": payload.content,
+        "tags": payload.tags,
+        "is_private": payload.is_private,
+        "edited_at": None,
+    }
     if payload.type == "log":
-        rec = LogEntry(team_id=payload.team_id, author_id=payload.author_id, content=payload.content, tags=payload.tags, is_private=payload.is_private, occurred_at=payload.occurred_at)
+        doc["occurred_at"] = payload.occurred_at
     else:
-        rec = JournalEntry(team_id=payload.team_id, author_id=payload.author_id, content=payload.content, tags=payload.tags, is_private=payload.is_private, title=payload.title)
-    doc = rec.model_dump()
-    now = datetime.now(timezone.utc)
+        doc["title"] = payload.title
+    now = datetime.now(_UTC)
     doc.update({"created_at": now, "updated_at": now})
-    res = db["record"].insert_one(doc)
+    res = await db["record"].insert_one(doc)
     return {"_id": str(res.inserted_id)}
 
-@app.get("/api/records")
-def list_records(
+# Fields returned by list views; full documents are never needed there
+RECORD_LIST_PROJECTION = {
+    "content": 1,
+    "type": 1,
+    "tags": 1,
+    "is_private": 1,
+    "author_id": 1,
+    "created_at": 1,
+    "occurred_at": 1,
+    "title": 1,
+}
+TRASH_LIST_PROJECTION = {**RECORD_LIST_PROJECTION, "deleted_at": 1, "purge_at": 1}
+
+@app.get("/api/records", response_model=None)
+async def list_records(
     team_id: str = Query(...),
     requester_id: Optional[str] = Query(None),
     type: Optional[str] = Query(None),
     include_deleted: bool = False,
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[datetime] = Query(None, description="Return records created before this time (keyset pagination)"),
+    before_id: Optional[str] = Query(None, description="_id of the last record seen; breaks created_at ties with before"),
 ):
+    if before_id and not before:
+        raise HTTPException(status_code=422, detail="before_id requires before")
     q: Dict[str, Any] = {"team_id": team_id}
     if type:
         q["type"] = type
     if not include_deleted:
-        q["deleted_at"] = {"$exists": False}
-    items = list(db["record"].find(q).sort("created_at", -1))
+        # Matches both unset and legacy null deleted_at
+        q["deleted_at"] = None
+    clauses: List[Dict[str, Any]] = []
     # Privacy filter: hide private records from non-authors by default
-    filtered = []
-    for it in items:
-        if it.get("is_private") and requester_id and requester_id != it.get("author_id"):
-            continue
-        it["_id"] = str(it["_id"]) 
-        filtered.append(it)
-    return filtered
+    if requester_id:
+        clauses.append({"$or": [{"is_private": {"$ne": True}}, {"author_id": requester_id}]})
+    if before:
+        if before_id:
+            # created_at is only millisecond-precise; (created_at, _id) keeps page boundaries exact
+            clauses.append({"$or": [
+                {"created_at": {"$lt": before}},
+                {"created_at": before, "_id": {"$lt": oid(before_id)}},
+            ]})
+        else:
+            q["created_at"] = {"$lt": before}
+    if clauses:
+        q["$and"] = clauses
+    items = await (
+        read_collection("record")
+        # Mixed live/trashed listings need deleted_at/purge_at to tell the two apart
+        .find(q, TRASH_LIST_PROJECTION if include_deleted else RECORD_LIST_PROJECTION)
+        .sort([("created_at", -1), ("_id", -1)])
+        .limit(limit)
+        .to_list(length=None)
+    )
+    return MongoJSONResponse(items)
 
 class UpdateRecordRequest(BaseModel):
     content: Optional[str] = None
@@ -215,48 +506,59 @@ class UpdateRecordRequest(BaseModel):
     title: Optional[str] = None
 
 @app.put("/api/records/{record_id}")
-def update_record(record_id: str, payload: UpdateRecordRequest):
+async def update_record(record_id: str, payload: UpdateRecordRequest):
     updates = {k: v for k, v in payload.model_dump(exclude_none=True).items()}
-    updates["updated_at"] = datetime.now(timezone.utc)
-    res = db["record"].update_one({"_id": oid(record_id)}, {"$set": updates})
+    updates["updated_at"] = datetime.now(_UTC)
+    res = await db["record"].update_one({"_id": oid(record_id)}, {"$set": updates})
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Record not found")
     return {"status": "ok"}
 
 @app.delete("/api/records/{record_id}")
-def soft_delete_record(record_id: str):
-    now = datetime.now(timezone.utc)
+async def soft_delete_record(record_id: str):
+    now = datetime.now(_UTC)
     purge = now + timedelta(days=30)
-    res = db["record"].update_one({"_id": oid(record_id)}, {"$set": {"deleted_at": now, "purge_at": purge}})
+    res = await db["record"].update_one({"_id": oid(record_id)}, {"$set": {"deleted_at": now, "purge_at": purge}})
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Record not found")
     return {"status": "moved_to_trash", "purge_at": purge.isoformat()}
 
 # ---------- Trash ----------
 
-@app.get("/api/trash")
-def list_trash(team_id: str):
-    items = list(db["record"].find({"team_id": team_id, "deleted_at": {"$exists": True}}).sort("deleted_at", -1))
-    for it in items:
-        it["_id"] = str(it["_id"]) 
-    return items
+@app.get("/api/trash", response_model=None)
+async def list_trash(team_id: str):
+    items = await read_collection("record").find({"team_id": team_id, "deleted_at": {"$type": "date"}}, TRASH_LIST_PROJECTION).sort("deleted_at", -1).to_list(length=None)
+    return MongoJSONResponse(items)
 
 @app.post("/api/trash/{record_id}/restore")
-def restore_record(record_id: str):
-    res = db["record"].update_one({"_id": oid(record_id)}, {"$unset": {"deleted_at": "", "purge_at": ""}})
+async def restore_record(record_id: str):
+    res = await db["record"].update_one({"_id": oid(record_id)}, {"$unset": {"deleted_at": "", "purge_at": ""}})
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Record not found")
     return {"status": "restored"}
 
+# Expired records are removed by the purge_at TTL index; this stays for manual/early purges
 @app.delete("/api/trash/purge")
-def purge_expired(team_id: Optional[str] = None, record_id: Optional[str] = None):
+async def purge_expired(
+    team_id: Optional[str] = None,
+    record_id: Optional[str] = None,
+    team_ids: Optional[List[str]] = Query(None),
+):
     if record_id:
-        res = db["record"].delete_one({"_id": oid(record_id)})
+        res = await db["record"].delete_one({"_id": oid(record_id)})
+        return {"deleted": res.deleted_count}
+    now = datetime.now(_UTC)
+    if team_ids:
+        if team_id and team_id not in team_ids:
+            team_ids = [*team_ids, team_id]
+        # One unordered bulk round-trip instead of a delete per team
+        ops = [DeleteMany({"team_id": t, "purge_at": {"$lte": now}}) for t in team_ids]
+        res = await db["record"].bulk_write(ops, ordered=False)
         return {"deleted": res.deleted_count}
-    q: Dict[str, Any] = {"purge_at": {"$lte": datetime.now(timezone.utc)}}
+    q: Dict[str, Any] = {"purge_at": {"$lte": now}}
     if team_id:
         q["team_id"] = team_id
-    res = db["record"].delete_many(q)
+    res = await db["record"].delete_many(q)
     return {"deleted": res.deleted_count}
 
 # ---------- Reminders (MVP: store + list; scheduling worker out of scope) ----------
@@ -270,23 +572,23 @@ class CreateReminderRequest(BaseModel):
     recipient_ids: List[str] = Field(default_factory=list)
     send_push: bool = True
 
-@app.post("/api/reminders")
-def create_reminder(payload: CreateReminderRequest):
-    rem = Reminder(**payload.model_dump()).model_dump()
-    now = datetime.now(timezone.utc)
-    res = db["reminder"].insert_one({**rem, "created_at": now})
+@app.post("/api/reminders", openapi_extra=json_body_doc(CreateReminderRequest))
+async def create_reminder(payload: CreateReminderRequest = Depends(json_body(CreateReminderRequest))):
+    rem = payload.model_dump()
+    now = datetime.now(_UTC)
+    res = await db["reminder"].insert_one({**rem, "created_at": now})
     return {"_id": str(res.inserted_id)}
 
-@app.get("/api/reminders")
-def list_reminders(team_id: str):
-    items = list(db["reminder"].find({"team_id": team_id}).sort("created_at", -1))
-    for it in items:
-        it["_id"] = str(it["_id"]) 
-    return items
+@app.get("/api/reminders", response_model=None)
+async def list_reminders(team_id: str):
+    items = await read_collection("reminder").find({"team_id": team_id}).sort("created_at", -1).to_list(length=None)
+    return MongoJSONResponse(items)
 
 # Note: Push delivery and real scheduling will be added in a later step.
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Multiple workers need an import string rather than the app object
+    uvicorn.run("main:app", host="0.0.0.0", port=port, loop="uvloop", http="httptools", workers=workers)
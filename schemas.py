@@ -10,10 +10,23 @@ Age and privacy policy
 These are defaults and can be overridden per-team via settings.
 """
 from __future__ import annotations
-from typing import List, Optional, Literal, Dict, Any
-from pydantic import BaseModel, Field, EmailStr
+import re
+from typing import Annotated, List, Optional, Literal, Dict, Any
+from pydantic import AfterValidator, BaseModel, Field
 from datetime import datetime
 
+# Shape-only email check; deliverability is not verified
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+def _check_email(value: str) -> str:
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("invalid email")
+    # Domains are case-insensitive; normalize like email-validator did so the unique index catches duplicates
+    local, domain = value.rsplit("@", 1)
+    return f"{local}@{domain.lower()}"
+
+Email = Annotated[str, AfterValidator(_check_email)]
+
 # ---------- Core ----------
 
 class TeamSettings(BaseModel):
@@ -36,7 +49,7 @@ class UserDevice(BaseModel):
     last_active_at: Optional[datetime] = None
 
 class User(BaseModel):
-    email: EmailStr
+    email: Email
     name: str
     password_hash: str
     age: Optional[int] = Field(None, ge=0, le=120)